@@ -35,7 +35,7 @@ def lbfgs_options(iprint, iters, lbfgs_tol, memory):
     return options
 
 
-def standard_scale(X):
+def standard_scale(X, dtype=None):
     """
     Standardize the input data by subtracting the mean and dividing by the standard deviation.
     Note that in the case of multi-output systems, scaling outputs changes the relative weight 
@@ -45,6 +45,10 @@ def standard_scale(X):
     ----------
     X : ndarray
         Input data array of shape (n_samples, n_features).
+    dtype : data-type, optional
+        Floating-point type of the returned arrays (e.g., np.float32). Mean and standard
+        deviation are always accumulated in double precision. If None (default), the
+        type of X is kept if floating-point, otherwise float64 is used.
 
     Returns
     -------
@@ -55,17 +59,25 @@ def standard_scale(X):
     gain : ndarray
         The gain values used for scaling each feature (=inverse of std, if nonzero, otherwise 1).
     """
-    xmean = np.mean(X, 0)
-    xstd = np.std(X, 0)
-    nX = xmean.shape[0]
-    xgain = np.ones(nX)
-    for i in range(nX):
-        if xstd[i] > 1.e-6:  # do not change gain in case std is approximately 0
-            xgain[i] = 1./xstd[i]
-    return (X - xmean) * xgain, xmean, xgain
-
-
-def unscale(Xs, offset, gain):
+    X = np.asarray(X)
+    if dtype is None:
+        dtype = X.dtype if np.issubdtype(X.dtype, np.floating) else np.float64
+    xmean = X.mean(0, dtype=np.float64)
+    # center X once, then get std from the centered data (no cancellation) and
+    # scale the same array in place
+    Xs = np.empty(X.shape, dtype)
+    np.subtract(X, xmean, out=Xs, casting='same_kind')
+    xstd = np.sqrt(np.einsum('ij,ij->j', Xs, Xs, dtype=np.float64)/X.shape[0])
+    # do not change gain in case std is approximately 0
+    mask = xstd > 1.e-6
+    xgain = np.where(mask, 1./np.where(mask, xstd, 1.), 1.)
+    xmean = xmean.astype(dtype, copy=False)
+    xgain = xgain.astype(dtype, copy=False)
+    Xs *= xgain  # scale in place, avoids a second temporary
+    return Xs, xmean, xgain
+
+
+def unscale(Xs, offset, gain, out=None):
     """
     Unscale scaled signal.
 
@@ -77,13 +89,25 @@ def unscale(Xs, offset, gain):
         Offset to be added to each row of X.
     gain : ndarray
         Gain to be multiplied to each row of X.
+    out : ndarray, optional
+        Array of shape (n_samples, n_features) where the result is stored, for example
+        to reuse the same buffer when unscaling repeatedly. If None (default), a new
+        array is allocated.
 
     Returns
     -------
     X : ndarray
         Unscaled array X = Xs/gain + offset
     """
-    return Xs/gain+offset
+    if out is not None:
+        X = np.divide(Xs, gain, out=out)
+        return np.add(X, offset, out=X)
+    X = Xs/gain
+    # add offset in place only if this changes neither shape nor type of the result
+    if isinstance(X, np.ndarray) and np.result_type(X, offset) == X.dtype and \
+            np.broadcast_shapes(X.shape, np.shape(offset)) == X.shape:
+        return np.add(X, offset, out=X)
+    return X+offset
 
 
 def compute_scores(Y_train, Yhat_train, Y_test, Yhat_test, fit='R2'):
@@ -115,63 +139,57 @@ def compute_scores(Y_train, Yhat_train, Y_test, Yhat_test, fit='R2'):
         Printout summarizing computed performance results
         """
 
-    ny = np.atleast_2d(Y_train).shape[1]
-    score_train = np.zeros(ny)
-    score_test = np.zeros(ny)
-    msg = ''
-    isR2 = fit.lower() == 'r2'
-    isBFR = fit.lower() == 'bfr'
-    isAcc = fit.lower()[0:3] == 'acc'
+    f = fit.lower()
+    isR2 = f == 'r2'
+    isBFR = f == 'bfr'
+    isAcc = f.startswith('acc')
     if not (isR2 or isBFR or isAcc):
         raise ValueError(
             "Invalid fit metric, only 'R2', 'BFR', and 'Accuracy' are supported.")
 
+    # work on (n_samples, n_outputs) arrays, scores are computed column-wise
+    Y_train = np.asarray(Y_train).reshape(len(Y_train), -1)
+    Yhat_train = np.asarray(Yhat_train).reshape(len(Yhat_train), -1)
+    Y_test = np.asarray(Y_test).reshape(len(Y_test), -1)
+    Yhat_test = np.asarray(Yhat_test).reshape(len(Yhat_test), -1)
+    ny = Y_train.shape[1]
+
+    if isR2 or isBFR:
+        # sums of squares per output, fused square-and-reduce via einsum
+        D_train = Yhat_train - Y_train
+        D_test = Yhat_test - Y_test
+        # accumulate in double precision regardless of the input type
+        sse_train = np.einsum('ij,ij->j', D_train, D_train, dtype=np.float64)
+        sse_test = np.einsum('ij,ij->j', D_test, D_test, dtype=np.float64)
+        Yc_train = Y_train - Y_train.mean(0, dtype=np.float64, keepdims=True)
+        Yc_test = Y_test - Y_test.mean(0, dtype=np.float64, keepdims=True)
+        tss_train = np.einsum('ij,ij->j', Yc_train, Yc_train)
+        tss_test = np.einsum('ij,ij->j', Yc_test, Yc_test)
+    if isR2:
+        score_train = 100. * (1. - sse_train / tss_train)
+        score_test = 100. * (1. - sse_test / tss_test)
+    elif isBFR:
+        score_train = 100. * (1. - np.sqrt(sse_train / tss_train))
+        score_test = 100. * (1. - np.sqrt(sse_test / tss_test))
+    elif isAcc:
+        score_train = np.count_nonzero(
+            Yhat_train == Y_train, axis=0)*(100./Y_train.shape[0])
+        score_test = np.count_nonzero(
+            Yhat_test == Y_test, axis=0)*(100./Y_test.shape[0])
+
     if isAcc:
         unit = "%"
     else:
         unit = ""
 
+    msg = ''
     if ny > 1:
-        for i in range(ny):
-            if isR2 or isBFR:
-                nY_train2 = np.sum((Y_train[:, i] - np.mean(Y_train[:, i]))**2)
-                nY_test2 = np.sum((Y_test[:, i] - np.mean(Y_test[:, i]))**2)
-            text = f"y{i+1}: "
-            if isR2:
-                score_train[i] = 100. * \
-                    (1. - np.sum((Yhat_train[:, i] -
-                     Y_train[:, i]) ** 2) / nY_train2)
-                score_test[i] = 100. * \
-                    (1. - np.sum((Yhat_test[:, i] -
-                     Y_test[:, i]) ** 2) / nY_test2)
-            elif isBFR:
-                score_train[i] = 100. * (1. - np.linalg.norm(
-                    Yhat_train[:, i] - Y_train[:, i]) / np.sqrt(nY_train2))
-                score_test[i] = 100. * (1. - np.linalg.norm(
-                    Yhat_test[:, i] - Y_test[:, i]) / np.sqrt(nY_test2))
-            elif isAcc:
-                score_train[i] = np.mean(Yhat_train[:, i] == Y_train[:, i])*100
-                score_test[i] = np.mean(Yhat_test[:, i] == Y_test[:, i])*100
-            text += f"{fit.capitalize()} score: training = {score_train[i]: 5.4f}{unit}, test = {score_test[i]: 5.4f}{unit}"
-            msg += '\n' + text
-            # print(text)
+        for i, (s_train, s_test) in enumerate(zip(score_train, score_test)):
+            msg += f"\ny{i+1}: {fit.capitalize()} score: training = {s_train: 5.4f}{unit}, test = {s_test: 5.4f}{unit}"
         msg += "\n-----\nAverage "
     else:
-        nY_train2 = np.sum((Y_train-np.mean(Y_train))**2)
-        nY_test2 = np.sum((Y_test - np.mean(Y_test))**2)
-        if isR2:
-            score_train = 100. * \
-                (1. - np.sum((Yhat_train - Y_train) ** 2) / nY_train2)
-            score_test = 100. * \
-                (1. - np.sum((Yhat_test - Y_test) ** 2) / nY_test2)
-        elif isBFR:
-            score_train = 100. * \
-                (1. - np.linalg.norm(Yhat_train-Y_train) / np.sqrt(nY_train2))
-            score_test = 100. * (1. - np.linalg.norm(Yhat_test -
-                                                     Y_test) / np.sqrt(nY_test2))
-        elif isAcc:
-            score_train = np.mean(Yhat_train == Y_train)*100
-            score_test = np.mean(Yhat_test == Y_test)*100
+        score_train = score_train[0]
+        score_test = score_test[0]
     msg += f"{fit.capitalize()} score:  training = {np.sum(score_train) / ny: 5.4f}{unit}, test = {np.sum(score_test) / ny: 5.4f}{unit}"
     return score_train, score_test, msg
 
@@ -187,10 +205,9 @@ def print_eigs(A):
         Input matrix
     """
     print("Eigenvalues of A:")
-    eigs = np.linalg.eig(A)[0]
-    for i in range(A.shape[0]):
-        print("%5.4f" % np.real(eigs[i]), end="")
-        im = np.imag(eigs[i])
+    eigs = np.linalg.eigvals(A)
+    for real, im in zip(eigs.real, eigs.imag):
+        print("%5.4f" % real, end="")
         if not im == 0.0:
             print(" + j%5.4f" % im)
         else:
@@ -245,8 +262,8 @@ def unscale_model(A, B, C, D, ymean, ygain, umean, ugain):
     umean : array
         offset = mean value of the input
     """
+    inv_ygain = (1./np.asarray(ygain)).reshape(-1, 1)
     B = B*ugain
-    C = (C.T/ygain).T
-    D = D*ugain
-    D = (D.T/ygain).T
+    C = C*inv_ygain
+    D = D*ugain*inv_ygain
     return A, B, C, D, ymean, umean
@@ -0,0 +1,146 @@
+# jax-sysid: A Python package for linear and nonlinear system identification and nonlinear regression using Jax.
+
+from jax_sysid.utils import standard_scale, unscale, compute_scores, unscale_model
+import numpy as np
+import jax.numpy as jnp
+import unittest
+
+
+class Test_utils(unittest.TestCase):
+
+    def test_standard_scale(self):
+        np.random.seed(3)
+        X = np.empty((1000, 4))
+        X[:, 0] = 2.+3.*np.random.randn(1000)
+        X[:, 1] = 1.e5+0.1  # large offset, zero variance: gain must be 1
+        X[:, 2] = 1.e4+1.e-3*np.random.randn(1000)  # large offset, small variance
+        X[:, 3] = 1.e3+1.e-8*np.random.randn(1000)  # std below threshold: gain must be 1
+        Xs, xmean, xgain = standard_scale(X)
+        self.assertTrue(np.allclose(xmean, np.mean(X, 0)))
+        self.assertTrue(np.allclose(
+            xgain, [1./np.std(X[:, 0]), 1., 1./np.std(X[:, 2]), 1.]))
+        self.assertTrue(np.allclose(Xs, (X-np.mean(X, 0))*xgain, atol=1.e-6))
+        self.assertTrue(np.allclose(unscale(Xs, xmean, xgain), X))
+        buf = np.empty_like(X)
+        self.assertIs(unscale(Xs, xmean, xgain, out=buf), buf)
+        self.assertTrue(np.allclose(buf, X))
+
+        # integer data: no overflow, float64 results
+        Xi = np.random.randint(-30000, 30000, size=(1000, 2)).astype(np.int32)
+        Xi[:, 1] = 7
+        Xs, xmean, xgain = standard_scale(Xi)
+        self.assertEqual(Xs.dtype, np.float64)
+        self.assertTrue(np.allclose(xgain, [1./np.std(Xi[:, 0].astype(np.float64)), 1.]))
+
+        # single precision, as input or as requested output type
+        Xf = 1000.+np.random.randn(1000, 2)
+        for Xs, xmean, xgain in (standard_scale(Xf.astype(np.float32)),
+                                 standard_scale(Xf, dtype=np.float32)):
+            self.assertEqual(Xs.dtype, np.float32)
+            self.assertEqual(xmean.dtype, np.float32)
+            self.assertEqual(xgain.dtype, np.float32)
+            self.assertTrue(np.allclose(xgain, 1./np.std(Xf, 0), rtol=1.e-4))
+            self.assertTrue(np.allclose(Xs, (Xf-np.mean(Xf, 0))/np.std(Xf, 0), atol=1.e-3))
+
+        # list and JAX inputs
+        Xs, xmean, xgain = standard_scale([[1., 2.], [3., 5.]])
+        self.assertTrue(np.allclose(Xs, [[-1., -1.], [1., 1.]]))
+        self.assertTrue(np.allclose(xmean, [2., 3.5]))
+        Xs, xmean, xgain = standard_scale(jnp.array(Xf-1000.))
+        self.assertTrue(np.allclose(xgain, 1./np.std(Xf, 0), rtol=1.e-5))
+        self.assertTrue(np.allclose(Xs, (Xf-np.mean(Xf, 0))/np.std(Xf, 0), atol=1.e-5))
+        return
+
+    def test_unscale(self):
+        # offset broadcast to a wider result, as for Xs/gain+offset
+        X = unscale(np.ones((5, 1)), np.arange(3.), 2.)
+        self.assertEqual(X.shape, (5, 3))
+        self.assertTrue(np.allclose(X, 0.5+np.arange(3.)))
+
+        # result type is promoted by the offset
+        Xs = np.ones((4, 2), dtype=np.float32)
+        gain = np.full(2, 2., dtype=np.float32)
+        X = unscale(Xs, np.array([1.e8, 0.]), gain)
+        self.assertEqual(X.dtype, np.float64)
+        self.assertTrue(np.all(X[:, 0] == 1.e8+0.5))
+        self.assertEqual(unscale(Xs, np.float32(1.), gain).dtype, np.float32)
+
+        # JAX input stays a JAX array
+        X = unscale(jnp.ones((4, 2)), np.ones(2), 2.)
+        self.assertIsInstance(X, type(jnp.ones(1)))
+        self.assertTrue(np.allclose(X, 1.5))
+        return
+
+    def test_compute_scores(self):
+        # SSE and TSS can be computed by hand: column 1 has TSS=5, SSE=2,
+        # column 2 has TSS=4, SSE=1
+        Y = np.array([[0., 1.], [1., 1.], [2., 3.], [3., 3.]])
+        Yhat = Y+np.array([[1., 0.], [-1., 0.], [0., 0.], [0., 1.]])
+        bfr1 = 100.*(1.-np.sqrt(.4))
+
+        R2, R2_test, msg = compute_scores(Y, Yhat, Y, Y, fit='R2')
+        self.assertTrue(np.allclose(R2, [60., 75.]))
+        self.assertTrue(np.allclose(R2_test, [100., 100.]))
+        self.assertIn("y2: ", msg)
+        self.assertIn("Average", msg)
+        BFR, BFR_test, _ = compute_scores(Y, Yhat, Y, Y, fit='BFR')
+        self.assertTrue(np.allclose(BFR, [bfr1, 50.]))
+        self.assertTrue(np.allclose(BFR_test, [100., 100.]))
+
+        # single output, as (n, 1) or 1-D arrays: scalar scores
+        for y, yhat, y_test, yhat_test in ((Y[:, :1], Yhat[:, :1], Y[:, 1:], Yhat[:, 1:]),
+                                           (Y[:, 0], Yhat[:, 0], Y[:, 1], Yhat[:, 1])):
+            R2, R2_test, msg = compute_scores(y, yhat, y_test, yhat_test, fit='R2')
+            self.assertEqual(np.ndim(R2), 0)
+            self.assertAlmostEqual(R2, 60.)
+            self.assertAlmostEqual(R2_test, 75.)
+            self.assertEqual(
+                msg, "R2 score:  training =  60.0000, test =  75.0000")
+            BFR, BFR_test, _ = compute_scores(
+                y, yhat, y_test, yhat_test, fit='BFR')
+            self.assertAlmostEqual(BFR, bfr1)
+            self.assertAlmostEqual(BFR_test, 50.)
+
+        # single precision data is scored in double precision
+        R2, _, _ = compute_scores(Y.astype(np.float32), Yhat.astype(np.float32),
+                                  Y, Y, fit='R2')
+        self.assertTrue(np.allclose(R2, [60., 75.]))
+
+        Y = np.array([[0, 1], [1, 1], [2, 0], [1, 0]])
+        Yhat = np.array([[0, 1], [1, 0], [2, 0], [0, 0]])
+        acc, acc_test, msg = compute_scores(Y, Yhat, Y, Y, fit='Accuracy')
+        self.assertTrue(np.allclose(acc, [75., 75.]))
+        self.assertTrue(np.allclose(acc_test, [100., 100.]))
+        self.assertIn("%", msg)
+        acc, acc_test, _ = compute_scores(
+            Y[:, 1], Yhat[:, 1], Y[:, 1], Yhat[:, 1], fit='acc')
+        self.assertEqual(acc, 75.)
+        self.assertEqual(acc_test, 75.)
+
+        with self.assertRaises(ValueError):
+            compute_scores(Y, Yhat, Y, Yhat, fit='MSE')
+        return
+
+    def test_unscale_model(self):
+        np.random.seed(3)
+        nx, ny, nu = 4, 2, 3
+        A = np.random.randn(nx, nx)
+        B = np.random.randn(nx, nu)
+        C = np.random.randn(ny, nx)
+        D = np.random.randn(ny, nu)
+        ymean, ygain = np.random.randn(ny), 0.5+np.random.rand(ny)
+        umean, ugain = np.random.randn(nu), 0.5+np.random.rand(nu)
+
+        A2, B2, C2, D2, ymean2, umean2 = unscale_model(
+            A, B, C, D, ymean, ygain, umean, ugain)
+        self.assertTrue(np.allclose(A2, A))
+        self.assertTrue(np.allclose(B2, B@np.diag(ugain)))
+        self.assertTrue(np.allclose(C2, np.diag(1./ygain)@C))
+        self.assertTrue(np.allclose(D2, np.diag(1./ygain)@D@np.diag(ugain)))
+        self.assertTrue(np.allclose(ymean2, ymean))
+        self.assertTrue(np.allclose(umean2, umean))
+        return
+
+
+if __name__ == '__main__':
+    unittest.main()